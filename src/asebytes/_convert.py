@@ -8,6 +8,8 @@ import numpy as np
 from ase.calculators.singlepoint import SinglePointCalculator
 from ase.cell import Cell
 
+from .decode import _ZERO_CELLDISP
+
 _SKIP_KEYS = frozenset(("cell", "pbc", "arrays.numbers"))
 
 
@@ -107,7 +109,7 @@ def dict_to_atoms(data: dict[str, Any], fast: bool = True, copy: bool = True) ->
             atoms.arrays["positions"] = np.zeros((n_atoms, 3))
         atoms.info = {}
         atoms.constraints = []
-        atoms._celldisp = np.zeros(3)
+        atoms._celldisp = _ZERO_CELLDISP
         atoms._calc = None
     else:
         atoms = ase.Atoms(numbers=numbers, cell=cell, pbc=pbc)
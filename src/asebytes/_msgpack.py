@@ -0,0 +1,148 @@
+"""msgpack helpers for the asebytes wire format.
+
+Plain-dtype ndarrays are packed as a single msgpack ExtType payload
+(dtype string, shape, raw buffer) instead of msgpack_numpy's five-key
+map. That shrinks the framing per array and lets decode rebuild the
+array without a dict round trip. Bool arrays are additionally
+bit-packed with np.packbits (one byte per eight flags). Structured/
+object dtypes, numpy scalars, and complex numbers still go through
+msgpack_numpy.
+
+Decoding accepts both the ExtType payload and the legacy map format, so
+data written by older asebytes versions stays readable.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import msgpack
+import msgpack_numpy as m
+import numpy as np
+
+# ExtType code for C-contiguous plain-dtype ndarrays.
+NDARRAY_EXT_CODE = 40
+# ExtType code for bool ndarrays, bit-packed via np.packbits (8x smaller).
+BOOL_NDARRAY_EXT_CODE = 41
+
+
+def encode_default(obj, chain=None):
+    """msgpack ``default`` callback: ndarrays as ExtType, rest via msgpack_numpy."""
+    if isinstance(obj, np.ndarray) and obj.dtype.kind not in ("V", "O"):
+        if not obj.flags.c_contiguous:
+            obj = np.ascontiguousarray(obj)
+        if obj.dtype == np.bool_:
+            try:
+                payload_packer = _local.payload_packer
+            except AttributeError:
+                payload_packer = _local.payload_packer = msgpack.Packer()
+            payload = payload_packer.pack(
+                (obj.shape, obj.size, np.packbits(obj).data)
+            )
+            return msgpack.ExtType(BOOL_NDARRAY_EXT_CODE, payload)
+        # obj.data hands msgpack the array's buffer directly; tobytes()
+        # would copy it once more before packing. The payload gets its
+        # own thread-local packer: this callback fires while the outer
+        # packer is mid-pack, so that one cannot be reused here, and
+        # msgpack.packb would construct (and grow) a fresh buffer per
+        # array.
+        try:
+            payload_packer = _local.payload_packer
+        except AttributeError:
+            payload_packer = _local.payload_packer = msgpack.Packer()
+        payload = payload_packer.pack((obj.dtype.str, obj.shape, obj.data))
+        return msgpack.ExtType(NDARRAY_EXT_CODE, payload)
+    return m.encode(obj, chain)
+
+
+def _unpack_bool_ndarray(data):
+    """Rebuild a bit-packed bool ndarray (always owns writable memory)."""
+    shape, size, buf = msgpack.unpackb(data)
+    bits = np.unpackbits(np.frombuffer(buf, dtype=np.uint8), count=size)
+    return bits.view(bool).reshape(shape)
+
+
+def _ext_hook(code, data):
+    """Rebuild an ndarray as a zero-copy read-only view over the payload."""
+    if code == NDARRAY_EXT_CODE:
+        dtype_str, shape, buf = msgpack.unpackb(data)
+        return np.frombuffer(buf, dtype=np.dtype(dtype_str)).reshape(shape)
+    if code == BOOL_NDARRAY_EXT_CODE:
+        return _unpack_bool_ndarray(data)
+    return msgpack.ExtType(code, data)
+
+
+def _ext_hook_writable(code, data):
+    """Rebuild an ndarray over a fresh bytearray, so it owns mutable memory."""
+    if code == NDARRAY_EXT_CODE:
+        dtype_str, shape, buf = msgpack.unpackb(data)
+        return np.ndarray(
+            buffer=bytearray(buf), dtype=np.dtype(dtype_str), shape=shape
+        )
+    if code == BOOL_NDARRAY_EXT_CODE:
+        return _unpack_bool_ndarray(data)
+    return msgpack.ExtType(code, data)
+
+
+def _map_hook_writable(obj, chain=None):
+    """Legacy-map hook that yields writable arrays in one copy.
+
+    Builds each array over a fresh bytearray instead of the read-only
+    np.frombuffer view plus full np.array(..., copy=True) pass.
+    """
+    if obj.get(b"nd") is True and obj.get(b"kind", b"") == b"":
+        return np.ndarray(
+            buffer=bytearray(obj[b"data"]),
+            dtype=np.dtype(obj[b"type"]),
+            shape=obj[b"shape"],
+        )
+    result = m.decode(obj, chain)
+    if isinstance(result, np.ndarray) and not result.flags.writeable:
+        result = result.copy()
+    return result
+
+
+# Packer construction is not free and encode() packs one value per field.
+# Reuse one Packer per thread (a Packer is stateful, so it cannot be
+# shared across threads — the async backends run sync code in worker
+# threads via asyncio.to_thread).
+_local = threading.local()
+
+
+def get_packer() -> msgpack.Packer:
+    """Return this thread's wire-format Packer.
+
+    Callers packing many values in a row (encode() packs one per field)
+    should fetch the packer once and call ``.pack`` per value instead of
+    going through :func:`packb`, which repeats the thread-local lookup.
+    The packer autoresets after each pack, and its internal buffer stays
+    warm across calls, so large arrays do not re-trigger buffer growth.
+    """
+    try:
+        return _local.packer
+    except AttributeError:
+        packer = _local.packer = msgpack.Packer(default=encode_default)
+        return packer
+
+
+def packb(value) -> bytes:
+    """Serialize one value with the asebytes wire format."""
+    return get_packer().pack(value)
+
+
+def unpackb(data: bytes, writable: bool = False):
+    """Deserialize one wire-format value.
+
+    Parameters
+    ----------
+    data : bytes
+        msgpack payload (ExtType or legacy msgpack_numpy map format).
+    writable : bool, default=False
+        If True, arrays own mutable memory (one copy). If False, arrays
+        are read-only views over the msgpack buffers where possible.
+    """
+    if writable:
+        return msgpack.unpackb(
+            data, ext_hook=_ext_hook_writable, object_hook=_map_hook_writable
+        )
+    return msgpack.unpackb(data, ext_hook=_ext_hook, object_hook=m.decode)
@@ -4,12 +4,21 @@ import msgpack_numpy as m
 import numpy as np
 from ase.calculators.singlepoint import SinglePointCalculator
 from ase.cell import Cell
+from ase.constraints import dict2constraint
+
+from ._msgpack import _ext_hook, _ext_hook_writable, _map_hook_writable
 
 _SKIP_KEYS = frozenset((b"cell", b"pbc", b"arrays.numbers"))
 
 _unpackb = msgpack.unpackb
 _m_decode = m.decode
 
+# ASE never mutates _celldisp in place (set_celldisp replaces the array
+# and get_celldisp returns a copy), so every decoded Atoms can share one
+# read-only zero displacement instead of allocating a fresh one per call.
+_ZERO_CELLDISP = np.zeros((3, 1))
+_ZERO_CELLDISP.flags.writeable = False
+
 
 def decode(data: dict[bytes, bytes], fast: bool = True, copy: bool = True) -> ase.Atoms:
     """
@@ -23,10 +32,10 @@ def decode(data: dict[bytes, bytes], fast: bool = True, copy: bool = True) -> as
         If True, use optimized direct attribute assignment (6x faster).
         If False, use standard Atoms constructor (safer but slower).
     copy : bool, default=True
-        If True, create writable copies of all numpy arrays from msgpack.
-        If False, use arrays as-is (read-only, but saves memory).
-        Set to True if you need to modify atoms after decoding.
-        Nested numpy arrays might still be read-only.
+        If True, decode numpy arrays into writable, owned memory.
+        If False, use read-only views over the msgpack buffers (saves a
+        copy per array). Set to True if you need to modify atoms after
+        decoding.
 
     Returns
     -------
@@ -40,27 +49,38 @@ def decode(data: dict[bytes, bytes], fast: bool = True, copy: bool = True) -> as
     KeyError
         If required key 'arrays.numbers' is missing.
     """
+    if copy:
+        ext_hook, map_hook = _ext_hook_writable, _map_hook_writable
+    else:
+        ext_hook, map_hook = _ext_hook, _m_decode
+
     if b"arrays.numbers" in data:
-        numbers_array = _unpackb(data[b"arrays.numbers"], object_hook=_m_decode)
-        if copy:
-            numbers_array = np.array(numbers_array, copy=True)
+        numbers_array = _unpackb(data[b"arrays.numbers"], ext_hook=ext_hook, object_hook=map_hook)
+        if not isinstance(numbers_array, np.ndarray):
+            numbers_array = np.asarray(numbers_array)
     else:
         numbers_array = np.array([], dtype=int)
 
     # Extract optional parameters with defaults
     if b"cell" in data:
-        cell_array = _unpackb(data[b"cell"], object_hook=_m_decode)
-        if copy:
-            cell_array = np.array(cell_array, copy=True)
+        cell_array = _unpackb(data[b"cell"], ext_hook=ext_hook, object_hook=map_hook)
     else:
         cell_array = None
 
     if b"pbc" in data:
-        pbc_array = _unpackb(data[b"pbc"], object_hook=_m_decode)
-        if isinstance(pbc_array, np.ndarray):
-            if copy:
-                pbc_array = np.array(pbc_array, copy=True)
-        else:
+        pbc_array = _unpackb(data[b"pbc"], ext_hook=ext_hook, object_hook=map_hook)
+        if isinstance(pbc_array, bytes):
+            if len(pbc_array) == 1:
+                # Compact bitfield: bit 0 = x, bit 1 = y, bit 2 = z.
+                bits = pbc_array[0]
+                pbc_array = np.array(
+                    [bits & 1 != 0, bits & 2 != 0, bits & 4 != 0], dtype=bool
+                )
+            else:
+                # Raw bool buffer (ndarray.tobytes()); np.asarray would
+                # collapse it to a 0-d truthiness check.
+                pbc_array = np.frombuffer(pbc_array, dtype=bool).copy()
+        elif not isinstance(pbc_array, np.ndarray):
             pbc_array = np.asarray(pbc_array, dtype=bool)
     else:
         pbc_array = np.array([False, False, False], dtype=bool)
@@ -86,7 +106,7 @@ def decode(data: dict[bytes, bytes], fast: bool = True, copy: bool = True) -> as
 
         atoms.info = {}
         atoms.constraints = []
-        atoms._celldisp = np.zeros(3)
+        atoms._celldisp = _ZERO_CELLDISP
         atoms._calc = None
     else:
         # Use standard Atoms constructor
@@ -97,18 +117,28 @@ def decode(data: dict[bytes, bytes], fast: bool = True, copy: bool = True) -> as
         if key in _SKIP_KEYS:
             continue
 
-        if key.startswith(b"arrays."):
-            array_data = _unpackb(data[key], object_hook=_m_decode)
-            if copy:
-                array_data = np.array(array_data, copy=True)
-            atoms.arrays[key[7:].decode()] = array_data
-        elif key.startswith(b"info."):
-            info_key = key[5:].decode()
-            info_array = _unpackb(data[key], object_hook=_m_decode)
-            if copy and isinstance(info_array, np.ndarray):
-                info_array = np.array(info_array, copy=True)
-            atoms.info[info_key] = info_array
-        elif key.startswith(b"calc."):
+        # Split the namespace off once; the startswith chain paid up to
+        # three prefix scans plus a slice per key.
+        prefix, sep, name = key.partition(b".")
+        if not sep:
+            if key == b"constraints":
+                constraints_data = _unpackb(data[key], ext_hook=ext_hook, object_hook=map_hook)
+                constraints = [
+                    dict2constraint(cd)
+                    for cd in constraints_data
+                ]
+                atoms.set_constraint(constraints)
+                continue
+            raise ValueError(f"Unknown key in data: {key}")
+
+        if prefix == b"arrays":
+            array_data = _unpackb(data[key], ext_hook=ext_hook, object_hook=map_hook)
+            if not isinstance(array_data, np.ndarray):
+                array_data = np.asarray(array_data)
+            atoms.arrays[name.decode()] = array_data
+        elif prefix == b"info":
+            atoms.info[name.decode()] = _unpackb(data[key], ext_hook=ext_hook, object_hook=map_hook)
+        elif prefix == b"calc":
             if _calc is None:
                 if fast:
                     # Bypass SinglePointCalculator.__init__ which calls
@@ -124,18 +154,7 @@ def decode(data: dict[bytes, bytes], fast: bool = True, copy: bool = True) -> as
                 else:
                     _calc = SinglePointCalculator(atoms)
                     atoms.calc = _calc
-            calc_key = key[5:].decode()
-            calc_array = _unpackb(data[key], object_hook=_m_decode)
-            if copy and isinstance(calc_array, np.ndarray):
-                calc_array = np.array(calc_array, copy=True)
-            _calc.results[calc_key] = calc_array
-        elif key == b"constraints":
-            constraints_data = _unpackb(data[key], object_hook=_m_decode)
-            constraints = [
-                ase.constraints.dict2constraint(cd)
-                for cd in constraints_data
-            ]
-            atoms.set_constraint(constraints)
+            _calc.results[name.decode()] = _unpackb(data[key], ext_hook=ext_hook, object_hook=map_hook)
         else:
             raise ValueError(f"Unknown key in data: {key}")
 
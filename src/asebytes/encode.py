@@ -1,10 +1,22 @@
 import ase
-import msgpack
-import msgpack_numpy as m
 import numpy as np
+from ase.constraints import FixConstraint
 
+from ._msgpack import get_packer
 
-def encode(atoms: ase.Atoms) -> dict[bytes, bytes]:
+# Constraint kwargs that hold index arrays. todict() emits them as Python
+# lists (one msgpack varint per element); routing them through the ndarray
+# codec ships a raw int32 buffer instead, which matters for FixAtoms on
+# large systems.
+_INDEX_KWARGS = {
+    "FixAtoms": ("indices",),
+    "FixBondLengths": ("pairs",),
+}
+
+
+def encode(
+    atoms: ase.Atoms, positions_dtype: np.dtype | type | None = None
+) -> dict[bytes, bytes]:
     """
     Serialize an ASE Atoms object into a dictionary of bytes.
 
@@ -12,6 +24,11 @@ def encode(atoms: ase.Atoms) -> dict[bytes, bytes]:
     ----------
     atoms : ase.Atoms
         Atoms object to serialize.
+    positions_dtype : np.dtype or type, optional
+        Downcast positions to this dtype before packing (e.g.
+        ``np.float32`` to halve the bytes on the wire). Lossy; only use
+        when the reduced precision is acceptable. The dtype travels in
+        the payload header, so decode restores it as stored.
 
     Returns
     -------
@@ -22,6 +39,12 @@ def encode(atoms: ase.Atoms) -> dict[bytes, bytes]:
     ------
     TypeError
         If input is not an ase.Atoms object.
+
+    Notes
+    -----
+    Floating-point arrays are emitted as raw buffers with their exact bit
+    patterns — NaN and Inf pass through unvalidated, and no extra scan
+    over the data is made.
     """
     if not isinstance(atoms, ase.Atoms):
         raise TypeError("Input must be an ase.Atoms object.")
@@ -32,34 +55,40 @@ def encode(atoms: ase.Atoms) -> dict[bytes, bytes]:
             "which is not supported by asebytes serialization."
         )
 
+    # One shared Packer per call; _msgpack.packb would repeat the
+    # thread-local lookup for every field.
+    pack = get_packer().pack
+
     data: dict[bytes, bytes] = {}
     cell: np.ndarray = atoms.get_cell().array
-    data[b"cell"] = msgpack.packb(cell, default=m.encode)
-    data[b"pbc"] = msgpack.packb(atoms.get_pbc(), default=m.encode)
+    data[b"cell"] = pack(cell)
+    data[b"pbc"] = pack(atoms.get_pbc())
 
-    for key in atoms.arrays:
-        data[f"arrays.{key}".encode()] = msgpack.packb(
-            atoms.arrays[key], default=m.encode
-        )
-    for key in atoms.info:
-        value = atoms.info[key]
-        data[f"info.{key}".encode()] = msgpack.packb(value, default=m.encode)
+    for key, value in atoms.arrays.items():
+        if key == "positions" and positions_dtype is not None:
+            value = value.astype(positions_dtype, copy=False)
+        data[b"arrays." + key.encode()] = pack(value)
+    for key, value in atoms.info.items():
+        data[b"info." + key.encode()] = pack(value)
     if atoms.calc is not None:
-        for key in atoms.calc.results:
-            value = atoms.calc.results[key]
-            data[f"calc.{key}".encode()] = msgpack.packb(value, default=m.encode)
+        for key, value in atoms.calc.results.items():
+            data[b"calc." + key.encode()] = pack(value)
 
     # Serialize constraints
     if atoms.constraints:
         constraints_data = []
         for constraint in atoms.constraints:
-            if not isinstance(constraint, ase.constraints.FixConstraint):
+            if not isinstance(constraint, FixConstraint):
                 raise TypeError(
                     f"Constraint {type(constraint).__name__} does not inherit "
                     f"from ase.constraints.FixConstraint and cannot be serialized."
                 )
-            constraints_data.append(constraint.todict())
-        if constraints_data:
-            data[b"constraints"] = msgpack.packb(constraints_data, default=m.encode)
+            cd = constraint.todict()
+            for kwarg in _INDEX_KWARGS.get(cd.get("name"), ()):
+                value = cd["kwargs"].get(kwarg)
+                if value is not None:
+                    cd["kwargs"][kwarg] = np.asarray(value, dtype=np.int32)
+            constraints_data.append(cd)
+        data[b"constraints"] = pack(constraints_data)
 
     return data
@@ -94,8 +94,12 @@ class ColumnMapping:
             )
         raw_numbers = hf_row[self.numbers]
         if self.species_are_strings:
-            result["arrays.numbers"] = np.array(
-                [_ase_atomic_numbers[s] for s in raw_numbers], dtype=int
+            # fromiter fills the array directly instead of building an
+            # intermediate Python list first.
+            result["arrays.numbers"] = np.fromiter(
+                (_ase_atomic_numbers[s] for s in raw_numbers),
+                dtype=int,
+                count=len(raw_numbers),
             )
         else:
             result["arrays.numbers"] = np.asarray(raw_numbers, dtype=int)
@@ -43,6 +43,11 @@ class _LMDBReadMixin:
         """Stream rows within a single LMDB read transaction."""
         byte_keys = [k.encode() for k in keys] if keys is not None else None
         with self._store.env.begin() as txn:
+            self._store._ensure_cache(txn)
+            if self._store._should_scan(indices, byte_keys):
+                for raw in self._store.scan_with_txn(txn, indices):
+                    yield None if raw is None else _deserialize_row(raw)
+                return
             for i in indices:
                 raw = self._store.get_with_txn(txn, i, byte_keys)
                 yield None if raw is None else _deserialize_row(raw)
@@ -52,6 +57,12 @@ class _LMDBReadMixin:
     ) -> list[dict[str, Any] | None]:
         byte_keys = [k.encode() for k in keys] if keys is not None else None
         with self._store.env.begin() as txn:
+            self._store._ensure_cache(txn)
+            if self._store._should_scan(indices, byte_keys):
+                return [
+                    None if raw is None else _deserialize_row(raw)
+                    for raw in self._store.scan_with_txn(txn, indices)
+                ]
             return [
                 None
                 if (raw := self._store.get_with_txn(txn, i, byte_keys)) is None
@@ -71,7 +82,7 @@ class _LMDBReadMixin:
             lmdb_keys = []
             for i in indices:
                 sort_key = self._store._resolve_sort_key(i)
-                lmdb_keys.append(str(sort_key).encode() + b"-" + byte_key)
+                lmdb_keys.append(b"%d-" % sort_key + byte_key)
             fetched = dict(txn.cursor().getmulti(lmdb_keys))
             return [
                 msgpack.unpackb(fetched[k], object_hook=m.decode)
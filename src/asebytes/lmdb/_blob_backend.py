@@ -1,5 +1,7 @@
+import itertools
 import os
 import struct
+from bisect import bisect_right
 from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
@@ -63,6 +65,7 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
         self._blocks: list[list[int]] | None = None
         self._schema_cache: list[bytes] | None = None
         self._block_sizes: list[int] | None = None
+        self._block_offsets: list[int] | None = None
         self._count_cache: int | None = None
 
     @staticmethod
@@ -96,6 +99,7 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
         self._blocks = None
         self._schema_cache = None
         self._block_sizes = None
+        self._block_offsets = None
         self._count_cache = None
 
     def _ensure_cache(self, txn) -> None:
@@ -118,6 +122,7 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
         if blk_count_bytes is None:
             self._blocks = []
             self._block_sizes = []
+            self._block_offsets = []
             return
 
         n_blocks = struct.unpack("<I", blk_count_bytes)[0]
@@ -125,6 +130,7 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
         if n_blocks == 0:
             self._blocks = []
             self._block_sizes = []
+            self._block_offsets = []
             return
 
         # Block sizes
@@ -132,6 +138,7 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
         if not sizes_bytes:
             raise RuntimeError("Corrupt LMDB metadata: missing __blk_sizes__")
         self._block_sizes = list(struct.unpack(f"<{n_blocks}I", sizes_bytes))
+        self._block_offsets = list(itertools.accumulate(self._block_sizes))
 
         # Load all blocks
         self._blocks = []
@@ -147,31 +154,30 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
     # ------------------------------------------------------------------
 
     def _resolve_sort_key(self, index: int) -> int:
-        """Resolve logical index to sort_key using cached blocks."""
-        total = sum(self._block_sizes)
+        """Resolve logical index to sort_key using cached block offsets."""
+        offsets = self._block_offsets
+        total = offsets[-1] if offsets else 0
         if index < 0:
             index += total
         if index < 0 or index >= total:
             raise IndexError(f"Index {index} out of range [0, {total})")
-        cumsum = 0
-        for i, size in enumerate(self._block_sizes):
-            if cumsum + size > index:
-                return self._blocks[i][index - cumsum]
-            cumsum += size
-        raise IndexError(f"Index {index} out of range [0, {total})")
+        blk = bisect_right(offsets, index)
+        start = offsets[blk - 1] if blk else 0
+        return self._blocks[blk][index - start]
 
     def _find_block(self, index: int) -> tuple[int, int]:
         """Find (block_index, local_offset) for a logical index.
 
         Also handles index == total (append position).
         """
-        cumsum = 0
-        for i, size in enumerate(self._block_sizes):
-            if cumsum + size > index:
-                return i, index - cumsum
-            cumsum += size
+        offsets = self._block_offsets
+        total = offsets[-1] if offsets else 0
+        if index < total:
+            blk = bisect_right(offsets, index)
+            start = offsets[blk - 1] if blk else 0
+            return blk, index - start
         # index == total count: return end of last block
-        if index == cumsum:
+        if index == total:
             if self._block_sizes:
                 last = len(self._block_sizes) - 1
                 return last, self._block_sizes[last]
@@ -187,6 +193,7 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
         n_blocks = len(self._blocks)
         txn.put(b"__blk_count__", struct.pack("<I", n_blocks))
         self._block_sizes = [len(blk) for blk in self._blocks]
+        self._block_offsets = list(itertools.accumulate(self._block_sizes))
         if n_blocks:
             txn.put(
                 b"__blk_sizes__",
@@ -263,6 +270,14 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
 
     def get(self, index: int, keys: list[bytes] | None = None) -> dict[bytes, bytes]:
         """Get data at index, optionally filtering to specific keys."""
+        if keys is not None and not keys:
+            # No fields requested: validate the index against the cached
+            # blocks and skip the read transaction entirely.
+            if self._blocks is None:
+                with self.env.begin() as txn:
+                    self._ensure_cache(txn)
+            self._resolve_sort_key(index)
+            return {}
         with self.env.begin() as txn:
             return self.get_with_txn(txn, index, keys)
 
@@ -272,12 +287,14 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
         """Get data at index using an existing LMDB transaction."""
         self._ensure_cache(txn)
         sort_key = self._resolve_sort_key(index)
-        sort_key_str = str(sort_key).encode()
-        prefix = sort_key_str + b"-"
+        prefix = b"%d-" % sort_key
 
         if keys is not None:
             keys_set = set(keys)
-            keys_to_fetch = [prefix + f for f in keys_set]
+            # Sorted probes let getmulti's cursor walk forward through the
+            # B-tree instead of re-seeking for each key (schema order
+            # already gives us this on the keys=None path).
+            keys_to_fetch = [prefix + f for f in sorted(keys_set)]
         else:
             keys_set = None
             keys_to_fetch = [prefix + f for f in self._schema_cache]
@@ -301,25 +318,67 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
 
     def keys(self, index: int) -> list[bytes]:
         """Get all available keys for a given index."""
-        with self.env.begin() as txn:
-            self._ensure_cache(txn)
+        if self._blocks is None:
+            with self.env.begin() as txn:
+                self._ensure_cache(txn)
+        # buffers=True hands back memoryviews into the LMDB map, so probing
+        # which fields exist does not copy the row's value blobs.
+        with self.env.begin(buffers=True) as txn:
             sort_key = self._resolve_sort_key(index)
-            sort_key_str = str(sort_key).encode()
-            prefix = sort_key_str + b"-"
+            prefix = b"%d-" % sort_key
 
             keys_to_check = [prefix + f for f in self._schema_cache]
             result = []
             if keys_to_check:
                 cursor = txn.cursor()
                 for key, _ in cursor.getmulti(keys_to_check):
-                    result.append(key[len(prefix) :])
+                    result.append(bytes(key[len(prefix) :]))
             return result
 
+    def _should_scan(self, indices: list[int], keys: list[bytes] | None) -> bool:
+        """Decide between a sequential cursor scan and per-row point lookups.
+
+        Scanning walks every data page once, so it only pays off for full
+        rows covering at least half the store. Restricted to strictly
+        increasing indices so each yielded row is a distinct dict.
+        """
+        if keys is not None or len(indices) < 2:
+            return False
+        if 2 * len(indices) < (self._count_cache or 0):
+            return False
+        return all(a < b for a, b in zip(indices, indices[1:]))
+
+    def scan_with_txn(
+        self, txn, indices: list[int]
+    ) -> Iterator[dict[bytes, bytes] | None]:
+        """Stream full rows for *indices* with one sequential cursor pass.
+
+        cursor.iternext walks B-tree pages in order instead of descending
+        from the root for every field key, which is much cheaper when most
+        of the store is read.
+        """
+        self._ensure_cache(txn)
+        sort_keys = [self._resolve_sort_key(i) for i in indices]
+        rows: dict[int, dict[bytes, bytes]] = {sk: {} for sk in sort_keys}
+        for key, value in txn.cursor().iternext():
+            if key.startswith(b"__"):
+                continue
+            sk_str, _, field = key.partition(b"-")
+            row = rows.get(int(sk_str))
+            if row is not None:
+                row[field] = value
+        for sk in sort_keys:
+            row = rows[sk]
+            yield row if row else None
+
     def get_many(
         self, indices: list[int], keys: list[bytes] | None = None
     ) -> list[dict[bytes, bytes] | None]:
         """Optimized bulk read using a single LMDB transaction."""
         with self.env.begin() as txn:
+            self._ensure_cache(txn)
+            if self._should_scan(indices, keys):
+                return list(self.scan_with_txn(txn, indices))
             return [self.get_with_txn(txn, i, keys) for i in indices]
 
     def iter_rows(
@@ -327,8 +386,12 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
     ) -> Iterator[dict[bytes, bytes] | None]:
         """Yield rows within a single LMDB read transaction."""
         with self.env.begin() as txn:
-            for i in indices:
-                yield self.get_with_txn(txn, i, keys)
+            self._ensure_cache(txn)
+            if self._should_scan(indices, keys):
+                yield from self.scan_with_txn(txn, indices)
+            else:
+                for i in indices:
+                    yield self.get_with_txn(txn, i, keys)
 
     # ------------------------------------------------------------------
     # ReadWriteBackend implementation
@@ -347,8 +410,7 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
                 sort_key = self._resolve_sort_key(index)
 
                 # Delete old data using schema
-                sort_key_str = str(sort_key).encode()
-                prefix = sort_key_str + b"-"
+                prefix = b"%d-" % sort_key
                 for field in self._schema_cache:
                     txn.delete(prefix + field)
             else:
@@ -378,9 +440,9 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
                 self._save_block_metadata(txn)
 
             # Write new data
-            sort_key_str = str(sort_key).encode()
+            prefix = b"%d-" % sort_key
             items_to_insert = [
-                (sort_key_str + b"-" + key, value) for key, value in data.items()
+                (prefix + key, value) for key, value in data.items()
             ]
             if items_to_insert:
                 cursor = txn.cursor()
@@ -430,8 +492,7 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
             self._save_block_metadata(txn)
 
             # Delete data keys using schema
-            sort_key_str = str(sort_key).encode()
-            prefix = sort_key_str + b"-"
+            prefix = b"%d-" % sort_key
             for field in self._schema_cache:
                 txn.delete(prefix + field)
 
@@ -480,9 +541,9 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
             self._save_block_metadata(txn)
 
             # Write data
-            sort_key_str = str(sort_key).encode()
+            prefix = b"%d-" % sort_key
             items_to_insert = [
-                (sort_key_str + b"-" + key, val) for key, val in value.items()
+                (prefix + key, val) for key, val in value.items()
             ]
             if items_to_insert:
                 cursor = txn.cursor()
@@ -519,7 +580,7 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
             for sort_key, item in zip(sort_keys, values):
                 if item is None:
                     item = {}
-                sort_key_str = str(sort_key).encode()
+                prefix = b"%d-" % sort_key
 
                 # Add sort_key to blocks
                 if not self._blocks or len(self._blocks[-1]) >= BLOCK_SIZE:
@@ -531,7 +592,7 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
 
                 # Collect data entries
                 for field_key, field_value in item.items():
-                    data_key = sort_key_str + b"-" + field_key
+                    data_key = prefix + field_key
                     all_items.append((data_key, field_value))
 
                 all_field_keys.update(item.keys())
@@ -575,7 +636,11 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
             # Update count
             self._set_count(txn, current_count + n)
 
-        self._invalidate_cache()
+        # The in-memory blocks/schema were updated in lockstep with the
+        # transaction, so keep the cache warm instead of forcing a full
+        # metadata reload on the next read.
+        self._block_offsets = list(itertools.accumulate(self._block_sizes))
+        self._count_cache = current_count + n
         return current_count + n
 
     def update(self, index: int, data: dict[bytes, bytes]) -> None:
@@ -586,8 +651,7 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
         with self.env.begin(write=True) as txn:
             self._ensure_cache(txn)
             sort_key = self._resolve_sort_key(index)
-            sort_key_str = str(sort_key).encode()
-            prefix = sort_key_str + b"-"
+            prefix = b"%d-" % sort_key
 
             items_to_update = [
                 (prefix + field_key, value) for field_key, value in data.items()
@@ -615,8 +679,7 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
                 if not row_data:
                     continue
                 sort_key = self._resolve_sort_key(start + i)
-                sort_key_str = str(sort_key).encode()
-                prefix = sort_key_str + b"-"
+                prefix = b"%d-" % sort_key
                 for field_key, value in row_data.items():
                     all_items.append((prefix + field_key, value))
                 new_fields.update(row_data.keys())
@@ -636,8 +699,8 @@ class LMDBBlobBackend(ReadWriteBackend[bytes, bytes]):
             all_items = []
             for i, value in enumerate(values):
                 sort_key = self._resolve_sort_key(start + i)
-                sort_key_str = str(sort_key).encode()
-                all_items.append((sort_key_str + b"-" + key, value))
+                prefix = b"%d-" % sort_key
+                all_items.append((prefix + key, value))
             if all_items:
                 cursor = txn.cursor()
                 cursor.putmulti(all_items, dupdata=False, overwrite=True)
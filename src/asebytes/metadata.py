@@ -1,7 +1,7 @@
-import msgpack
-import msgpack_numpy as m
 import numpy as np
 
+from ._msgpack import unpackb as _unpackb
+
 
 def get_metadata(data: dict[bytes, bytes]) -> dict[str, dict]:
     """
@@ -30,7 +30,7 @@ def get_metadata(data: dict[bytes, bytes]) -> dict[str, dict]:
         key = key_bytes.decode("utf-8")
 
         # Deserialize the value
-        value = msgpack.unpackb(value_bytes, object_hook=m.decode)
+        value = _unpackb(value_bytes)
 
         # Determine type and extract metadata
         metadata[key] = _get_value_metadata(value)
@@ -6,10 +6,16 @@ import pytest
 import asebytes
 
 
-@pytest.fixture
-def io(tmp_path):
-    """Create an ASEIO instance for testing."""
-    return asebytes.ASEIO(str(tmp_path / "test.lmdb"))
+@pytest.fixture(scope="module")
+def io(tmp_path_factory):
+    """Share one LMDB environment across the module (env open is not free)."""
+    return asebytes.ASEIO(str(tmp_path_factory.mktemp("aseio_update") / "test.lmdb"))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_io(io):
+    """Clear the shared database before each test instead of reopening it."""
+    io.clear()
 
 
 def test_update_info_add_new_keys(io, ethanol):
@@ -34,8 +40,9 @@ def test_update_info_add_new_keys(io, ethanol):
 
 def test_update_info_overwrite_existing(io, ethanol):
     """Test overwriting existing info keys."""
-    # Arrange: Store atoms with initial info
-    atoms = ethanol[0].copy()
+    # Arrange: Store atoms with initial info (fixture data is test-local,
+    # so mutating it directly is fine — no defensive copy needed)
+    atoms = ethanol[0]
     atoms.info["s22"] = 100.0
     io[0] = atoms
 
@@ -230,10 +237,11 @@ def test_update_multiple_indices_independently(io, ethanol):
 def test_update_preserves_original_atoms_structure(io, ethanol):
     """Test that update preserves cell, pbc, and other core atom properties."""
     # Arrange
+    # update() never touches the source Atoms, so no copies needed here
     io[0] = ethanol[0]
-    original_positions = ethanol[0].positions.copy()
-    original_numbers = ethanol[0].numbers.copy()
-    original_cell = ethanol[0].cell.array.copy()
+    original_positions = ethanol[0].positions
+    original_numbers = ethanol[0].numbers
+    original_cell = ethanol[0].cell.array
 
     # Act: Update with new info
     io.update(0, info={"new_property": "value"})
@@ -321,9 +329,9 @@ def test_update_does_not_affect_other_entries(io, ethanol):
     io[0] = ethanol[0]
     io[1] = ethanol[1]
 
-    # Get initial state of index 1
+    # Get initial state of index 1 (a fresh decode — nothing aliases it)
     atoms1_before = io[1]
-    info1_before = atoms1_before.info.copy()
+    info1_before = atoms1_before.info
 
     # Act: Update index 0
     io.update(0, info={"test_key": "test_value"})
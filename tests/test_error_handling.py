@@ -7,6 +7,8 @@ This module tests expected failures and error conditions:
 - IndexError for out-of-bounds access
 """
 
+import msgpack
+import msgpack_numpy as m
 import numpy as np
 import pytest
 from ase import Atoms
@@ -116,9 +118,6 @@ def test_encode_with_integer_raises_typeerror():
 
 def test_decode_missing_cell_uses_default():
     """Test that missing cell key uses default empty cell."""
-    import msgpack
-    import msgpack_numpy as m
-
     data = {
         b"arrays.numbers": msgpack.packb(np.array([1]), default=m.encode),
     }
@@ -134,9 +133,6 @@ def test_decode_pbc_as_plain_list():
     This happens when a server stores pbc as a Python list (e.g. from MongoDB)
     and re-packs with plain msgpack instead of msgpack_numpy.
     """
-    import msgpack
-    import msgpack_numpy as m
-
     data = {
         b"cell": msgpack.packb(np.eye(3) * 10, default=m.encode),
         b"pbc": msgpack.packb([True, True, True]),  # plain list, no numpy
@@ -155,9 +151,6 @@ def test_decode_pbc_as_plain_list():
 
 def test_decode_missing_pbc_uses_default():
     """Test that missing pbc key uses default (False, False, False)."""
-    import msgpack
-    import msgpack_numpy as m
-
     data = {
         b"cell": msgpack.packb(np.eye(3), default=m.encode),
         b"arrays.numbers": msgpack.packb(np.array([1]), default=m.encode),
@@ -169,9 +162,6 @@ def test_decode_missing_pbc_uses_default():
 
 def test_decode_missing_numbers_creates_empty_atoms():
     """Test that missing arrays.numbers creates an empty Atoms object."""
-    import msgpack
-    import msgpack_numpy as m
-
     data = {
         b"cell": msgpack.packb(np.eye(3), default=m.encode),
         b"pbc": msgpack.packb(np.array([True, True, True]), default=m.encode),
@@ -181,13 +171,15 @@ def test_decode_missing_numbers_creates_empty_atoms():
     assert len(atoms) == 0
 
 
-def test_decode_with_unknown_key_raises_valueerror():
-    """Test that unknown top-level keys raise ValueError."""
-    import msgpack
-    import msgpack_numpy as m
+@pytest.fixture(scope="module")
+def h_baseline():
+    """Well-formed encoded payload for tests that perturb single keys."""
+    return asebytes.encode(Atoms("H", positions=[[0, 0, 0]]))
 
-    atoms = Atoms("H", positions=[[0, 0, 0]])
-    data = asebytes.encode(atoms)
+
+def test_decode_with_unknown_key_raises_valueerror(h_baseline):
+    """Test that unknown top-level keys raise ValueError."""
+    data = dict(h_baseline)
     # Add an unknown key
     data[b"unknown_key"] = msgpack.packb("value", default=m.encode)
 
@@ -195,13 +187,9 @@ def test_decode_with_unknown_key_raises_valueerror():
         asebytes.decode(data)
 
 
-def test_decode_with_invalid_prefix_raises_valueerror():
+def test_decode_with_invalid_prefix_raises_valueerror(h_baseline):
     """Test that keys with invalid prefixes raise ValueError."""
-    import msgpack
-    import msgpack_numpy as m
-
-    atoms = Atoms("H", positions=[[0, 0, 0]])
-    data = asebytes.encode(atoms)
+    data = dict(h_baseline)
     # Add a key with invalid prefix
     data[b"invalid.prefix.key"] = msgpack.packb("value", default=m.encode)
 
@@ -212,9 +200,6 @@ def test_decode_with_invalid_prefix_raises_valueerror():
 @pytest.mark.parametrize("fast", [True, False])
 def test_decode_empty_atoms_both_modes(fast):
     """Test that empty data creates empty atoms in both fast modes."""
-    import msgpack
-    import msgpack_numpy as m
-
     data = {
         b"cell": msgpack.packb(np.eye(3), default=m.encode),
         b"pbc": msgpack.packb(np.array([True, True, True]), default=m.encode),
@@ -226,19 +211,38 @@ def test_decode_empty_atoms_both_modes(fast):
 
 # =============================================================================
 # Tests for BlobIO errors
+#
+# All tests share one LMDB environment per IO class (env open is the
+# dominant cost here) and get a cleared database instead of a fresh one.
 # =============================================================================
 
 
-def test_bytesio_getitem_nonexistent_index_raises_indexerror(tmp_path):
+@pytest.fixture(scope="module")
+def _blob_io_module(tmp_path_factory, fast_lmdb_kwargs):
+    return asebytes.BlobIO(
+        asebytes.LMDBBlobBackend(
+            str(tmp_path_factory.mktemp("blob_errors") / "test.lmdb"),
+            **fast_lmdb_kwargs,
+        )
+    )
+
+
+@pytest.fixture
+def blob_io(_blob_io_module):
+    _blob_io_module.clear()
+    return _blob_io_module
+
+
+def test_bytesio_getitem_nonexistent_index_raises_indexerror(blob_io):
     """Test that accessing non-existent index raises IndexError."""
-    io = asebytes.BlobIO(asebytes.LMDBBlobBackend(str(tmp_path / "test.lmdb")))
+    io = blob_io
     with pytest.raises(IndexError):
         _ = io[0]
 
 
-def test_bytesio_getitem_negative_index(tmp_path):
+def test_bytesio_getitem_negative_index(blob_io):
     """Test that negative indices are normalized correctly."""
-    io = asebytes.BlobIO(asebytes.LMDBBlobBackend(str(tmp_path / "test.lmdb")))
+    io = blob_io
     io[0] = {b"test": b"data"}
     # Negative indices are normalized: -1 refers to the last element
     assert io[-1] == {b"test": b"data"}
@@ -247,41 +251,41 @@ def test_bytesio_getitem_negative_index(tmp_path):
         _ = io[-5]
 
 
-def test_bytesio_delitem_out_of_bounds_raises_indexerror(tmp_path):
+def test_bytesio_delitem_out_of_bounds_raises_indexerror(blob_io):
     """Test that deleting out-of-bounds index raises IndexError."""
-    io = asebytes.BlobIO(asebytes.LMDBBlobBackend(str(tmp_path / "test.lmdb")))
+    io = blob_io
     io[0] = {b"test": b"data"}
 
     with pytest.raises(IndexError, match="Index 5 out of range"):
         del io[5]
 
 
-def test_bytesio_delitem_negative_out_of_bounds_raises_indexerror(tmp_path):
+def test_bytesio_delitem_negative_out_of_bounds_raises_indexerror(blob_io):
     """Test that deleting negative out-of-bounds index raises IndexError."""
-    io = asebytes.BlobIO(asebytes.LMDBBlobBackend(str(tmp_path / "test.lmdb")))
+    io = blob_io
     io[0] = {b"test": b"data"}
 
     with pytest.raises(IndexError):
         del io[-2]
 
 
-def test_bytesio_get_nonexistent_index_raises_indexerror(tmp_path):
+def test_bytesio_get_nonexistent_index_raises_indexerror(blob_io):
     """Test that get() with non-existent index raises IndexError."""
-    io = asebytes.BlobIO(asebytes.LMDBBlobBackend(str(tmp_path / "test.lmdb")))
+    io = blob_io
     with pytest.raises(IndexError):
         io.get(0)
 
 
-def test_bytesio_keys_nonexistent_raises_indexerror(tmp_path):
+def test_bytesio_keys_nonexistent_raises_indexerror(blob_io):
     """Test that keys() with non-existent index raises IndexError."""
-    io = asebytes.BlobIO(asebytes.LMDBBlobBackend(str(tmp_path / "test.lmdb")))
+    io = blob_io
     with pytest.raises(IndexError):
         io.keys(0)
 
 
-def test_bytesio_get_with_invalid_keys_raises_keyerror(tmp_path):
+def test_bytesio_get_with_invalid_keys_raises_keyerror(blob_io):
     """Test that get() with any invalid keys raises KeyError."""
-    io = asebytes.BlobIO(asebytes.LMDBBlobBackend(str(tmp_path / "test.lmdb")))
+    io = blob_io
     io[0] = {b"key1": b"value1", b"key2": b"value2"}
 
     # Requesting only nonexistent keys should raise KeyError
@@ -297,9 +301,9 @@ def test_bytesio_get_with_invalid_keys_raises_keyerror(tmp_path):
         io.get(0, keys=[b"key1", b"nonexistent_key"])
 
 
-def test_bytesio_getitem_after_delete_raises_indexerror(tmp_path):
+def test_bytesio_getitem_after_delete_raises_indexerror(blob_io):
     """Test that accessing deleted index raises IndexError."""
-    io = asebytes.BlobIO(asebytes.LMDBBlobBackend(str(tmp_path / "test.lmdb")))
+    io = blob_io
     io[0] = {b"test": b"data1"}
     io[1] = {b"test": b"data2"}
     del io[0]
@@ -310,9 +314,9 @@ def test_bytesio_getitem_after_delete_raises_indexerror(tmp_path):
         _ = io[1]
 
 
-def test_bytesio_delete_from_empty_raises_indexerror(tmp_path):
+def test_bytesio_delete_from_empty_raises_indexerror(blob_io):
     """Test that deleting from empty BlobIO raises IndexError."""
-    io = asebytes.BlobIO(asebytes.LMDBBlobBackend(str(tmp_path / "test.lmdb")))
+    io = blob_io
     with pytest.raises(IndexError, match="Index 0 out of range"):
         del io[0]
 
@@ -322,16 +326,30 @@ def test_bytesio_delete_from_empty_raises_indexerror(tmp_path):
 # =============================================================================
 
 
-def test_aseio_getitem_nonexistent_index_raises_indexerror(tmp_path):
+@pytest.fixture(scope="module")
+def _ase_io_module(tmp_path_factory, fast_lmdb_kwargs):
+    return asebytes.ASEIO(
+        str(tmp_path_factory.mktemp("aseio_errors") / "test.lmdb"),
+        **fast_lmdb_kwargs,
+    )
+
+
+@pytest.fixture
+def ase_io(_ase_io_module):
+    _ase_io_module.clear()
+    return _ase_io_module
+
+
+def test_aseio_getitem_nonexistent_index_raises_indexerror(ase_io):
     """Test that accessing non-existent index raises IndexError."""
-    io = asebytes.ASEIO(str(tmp_path / "test.lmdb"))
+    io = ase_io
     with pytest.raises(IndexError):
         _ = io[0]
 
 
-def test_aseio_delitem_out_of_bounds_raises_indexerror(tmp_path):
+def test_aseio_delitem_out_of_bounds_raises_indexerror(ase_io):
     """Test that deleting out-of-bounds index raises IndexError."""
-    io = asebytes.ASEIO(str(tmp_path / "test.lmdb"))
+    io = ase_io
     atoms = Atoms("H", positions=[[0, 0, 0]])
     io[0] = atoms
 
@@ -339,29 +357,29 @@ def test_aseio_delitem_out_of_bounds_raises_indexerror(tmp_path):
         del io[5]
 
 
-def test_aseio_setitem_with_non_atoms_raises_typeerror(tmp_path):
+def test_aseio_setitem_with_non_atoms_raises_typeerror(ase_io):
     """Test that setting non-Atoms object raises TypeError."""
-    io = asebytes.ASEIO(str(tmp_path / "test.lmdb"))
+    io = ase_io
     with pytest.raises(TypeError, match="Input must be an ase.Atoms object"):
         io[0] = "not an atoms object"
 
 
-def test_aseio_insert_with_non_atoms_raises_typeerror(tmp_path):
+def test_aseio_insert_with_non_atoms_raises_typeerror(ase_io):
     """Test that inserting non-Atoms object raises TypeError."""
-    io = asebytes.ASEIO(str(tmp_path / "test.lmdb"))
+    io = ase_io
     with pytest.raises(TypeError, match="Input must be an ase.Atoms object"):
         io.insert(0, {"not": "atoms"})
 
 
-def test_aseio_extend_with_non_atoms_list_raises_typeerror(tmp_path):
+def test_aseio_extend_with_non_atoms_list_raises_typeerror(ase_io):
     """Test that extending with non-Atoms objects raises TypeError."""
-    io = asebytes.ASEIO(str(tmp_path / "test.lmdb"))
+    io = ase_io
     with pytest.raises(TypeError, match="Input must be an ase.Atoms object"):
         io.extend(["not", "atoms", "objects"])
 
 
-def test_aseio_delete_from_empty_raises_indexerror(tmp_path):
+def test_aseio_delete_from_empty_raises_indexerror(ase_io):
     """Test that deleting from empty ASEIO raises IndexError."""
-    io = asebytes.ASEIO(str(tmp_path / "test.lmdb"))
+    io = ase_io
     with pytest.raises(IndexError, match="Index 0 out of range"):
         del io[0]
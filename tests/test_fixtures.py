@@ -66,31 +66,27 @@ def test_aseio_instance_fixture(aseio_instance, simple_atoms):
     assert len(aseio_instance) == 1
 
 
-def test_fixture_roundtrip_simple(simple_atoms):
+def test_fixture_roundtrip_simple(simple_atoms, simple_atoms_encoded):
     """Test roundtrip with simple_atoms fixture."""
-    byte_data = asebytes.encode(simple_atoms)
-    recovered = asebytes.decode(byte_data)
+    recovered = asebytes.decode(simple_atoms_encoded)
     assert recovered == simple_atoms
 
 
-def test_fixture_roundtrip_with_info(atoms_with_info):
+def test_fixture_roundtrip_with_info(atoms_with_info, atoms_with_info_encoded):
     """Test roundtrip with atoms_with_info fixture."""
-    byte_data = asebytes.encode(atoms_with_info)
-    recovered = asebytes.decode(byte_data)
+    recovered = asebytes.decode(atoms_with_info_encoded)
     assert recovered == atoms_with_info
 
 
-def test_fixture_roundtrip_with_calc(atoms_with_calc):
+def test_fixture_roundtrip_with_calc(atoms_with_calc, atoms_with_calc_encoded):
     """Test roundtrip with atoms_with_calc fixture."""
-    byte_data = asebytes.encode(atoms_with_calc)
-    recovered = asebytes.decode(byte_data)
+    recovered = asebytes.decode(atoms_with_calc_encoded)
     assert recovered.calc.results["energy"] == atoms_with_calc.calc.results["energy"]
 
 
-def test_fixture_in_bytesio(bytesio_instance, h2o_atoms):
+def test_fixture_in_bytesio(bytesio_instance, h2o_atoms, h2o_atoms_encoded):
     """Test using fixture with BlobIO."""
-    byte_data = asebytes.encode(h2o_atoms)
-    bytesio_instance[0] = byte_data
+    bytesio_instance[0] = h2o_atoms_encoded
     recovered_data = bytesio_instance[0]
     recovered_atoms = asebytes.decode(recovered_data)
     assert recovered_atoms == h2o_atoms
@@ -160,3 +160,32 @@ def test_decode_empty_with_cell_and_pbc(fast):
     assert atoms.positions.shape == (0, 3)
     assert list(atoms.pbc) == [True, True, True]
     assert np.allclose(atoms.cell, cell)
+
+
+def test_decode_pbc_raw_bool_buffer():
+    """Test that pbc packed as a raw bool buffer keeps its per-axis values."""
+    numbers = np.array([6], dtype=np.int32)
+    pbc = np.array([True, False, True], dtype=bool).tobytes()
+
+    data = {
+        b"arrays.numbers": msgpack.packb(numbers, default=m.encode),
+        b"pbc": msgpack.packb(pbc),
+    }
+
+    atoms = asebytes.decode(data)
+
+    np.testing.assert_array_equal(atoms.pbc, [True, False, True])
+
+
+def test_decode_pbc_bitfield():
+    """Test that pbc packed as a single bitfield byte decodes per axis."""
+    numbers = np.array([6], dtype=np.int32)
+
+    data = {
+        b"arrays.numbers": msgpack.packb(numbers, default=m.encode),
+        b"pbc": msgpack.packb(bytes([0b101])),  # x and z periodic
+    }
+
+    atoms = asebytes.decode(data)
+
+    np.testing.assert_array_equal(atoms.pbc, [True, False, True])
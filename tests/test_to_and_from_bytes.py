@@ -148,3 +148,19 @@ def test_calc_is_none_after_round_trip(h2o_atoms):
     # Verify no calc.* keys were serialized
     calc_keys = [key for key in byte_data if key.startswith(b"calc.")]
     assert len(calc_keys) == 0
+
+
+def test_positions_dtype_downcast(ethanol):
+    """Test opt-in float32 positions via the positions_dtype parameter."""
+    atoms = ethanol[0]
+    byte_data = asebytes.encode(atoms, positions_dtype=np.float32)
+    recovered_atoms = asebytes.decode(byte_data)
+
+    # Positions come back as stored (float32), halving the payload
+    assert recovered_atoms.positions.dtype == np.float32
+    assert np.allclose(recovered_atoms.positions, atoms.positions, atol=1e-5)
+    full_size = len(asebytes.encode(atoms)[b"arrays.positions"])
+    assert len(byte_data[b"arrays.positions"]) < full_size
+
+    # Default stays lossless float64
+    assert asebytes.decode(asebytes.encode(atoms)).positions.dtype == np.float64